@@ -1,4 +1,7 @@
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class DBSettings(BaseSettings):
     DB: str
@@ -8,9 +11,28 @@ class DBSettings(BaseSettings):
     PORT: int
     NAMEDB: str
 
-    @property
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+    @cached_property
     def DATABASE_URL(self) -> str:
         return f"{self.DB}://{self.USERDB}:{self.PASSWORDDB}@{self.NAME_SERVICEDB}:{self.PORT}/{self.NAMEDB}"
 
-    class Config:
-        env_file = ".env"
+
+class MySQLSettings(BaseSettings):
+    MYSQL_USER: str = Field(default="root", min_length=1)
+    MYSQL_PASSWORD: str = ""
+    MYSQL_HOST: str = "localhost"
+    MYSQL_PORT: int = 3306
+    MYSQL_DATABASE: str = Field(default="database_mysql", min_length=1)
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+
+@lru_cache(maxsize=1)
+def _get_db_settings() -> DBSettings:
+    return DBSettings()
+
+
+@lru_cache(maxsize=1)
+def _get_mysql_settings() -> MySQLSettings:
+    return MySQLSettings()
@@ -2,10 +2,13 @@ import os
 import logging
 from typing import Optional, Callable
 from abc import ABC, abstractmethod
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError
-from app.infrastructure.config.db_config import DBSettings
+from app.infrastructure.config.db_config import _get_db_settings, _get_mysql_settings
 from app.infrastructure.base import Base
 from app.infrastructure.error_handlers import (
     ErrorHandler,
@@ -14,7 +17,36 @@ from app.infrastructure.error_handlers import (
     RetryConfig,
 )
 
+SQLITE_MEMORY_PATHS = (":memory:", "")
+
+# Pool compartido por los motores de servidor (PostgreSQL y MySQL).
+# LIFO + pool pequeño: pocas conexiones ociosas, mismo pico (2 + 13)
+SERVER_POOL_CONFIG = {
+    "pool_size": 2,
+    "max_overflow": 13,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+    "echo": False,
+}
+
+# Configurar SQLite para mejor concurrencia
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=10000",
+)
+
 class DatabaseStrategy(ABC):
+    __slots__ = (
+        "logger",
+        "engine",
+        "SessionLocal",
+        "_connection_validated",
+        "error_handler",
+    )
+
     def __init__(self, logger: logging.Logger = None):
         self.logger = logger or logging.getLogger(__name__)
         self.engine = None
@@ -37,9 +69,10 @@ class DatabaseStrategy(ABC):
 
     def validate_connection(self) -> bool:
         try:
-            session = self.get_session()
-            session.execute(text("SELECT 1;"))
-            session.close()
+            if self.engine is None:
+                self._initialize_engine_safe()
+            # Abrir y devolver una conexión al pool basta, sin crear una Session
+            self.engine.connect().close()
             self._connection_validated = True
             self.logger.info("✅ Conexión validada correctamente")
             return True
@@ -53,7 +86,13 @@ class DatabaseStrategy(ABC):
 
     def create_tables_if_not_exist(self):
         try:
-            Base.metadata.create_all(bind=self.engine)
+            existing_tables = set(inspect(self.engine).get_table_names())
+            # Todas las tablas ya existen: no se emite DDL
+            if set(Base.metadata.tables) <= existing_tables:
+                self.logger.info("✅ Tablas verificadas correctamente")
+                return
+            # En una BD vacía se omite la comprobación previa de cada tabla
+            Base.metadata.create_all(bind=self.engine, checkfirst=bool(existing_tables))
             self.logger.info("✅ Tablas verificadas/creadas correctamente")
         except Exception as e:
             self.logger.error("❌ Error creando tablas: %s", e)
@@ -61,14 +100,17 @@ class DatabaseStrategy(ABC):
 
 
 class PostgreSQLStrategy(DatabaseStrategy):
+    __slots__ = ("_conn_str",)
 
     def __init__(self, logger=None, **kwargs):
         super().__init__(logger, **kwargs)
+        self._conn_str: Optional[str] = None
         self._initialize_engine_safe()
 
     def get_connection_string(self) -> str:
-        db_settings = DBSettings()
-        return db_settings.DATABASE_URL
+        if self._conn_str is None:
+            self._conn_str = _get_db_settings().DATABASE_URL
+        return self._conn_str
 
     @retry_with_backoff(
         config=RetryConfig(max_retries=3, base_delay=2.0),
@@ -76,23 +118,63 @@ class PostgreSQLStrategy(DatabaseStrategy):
     )
     def _initialize_engine_safe(self):
         connection_string = self.get_connection_string()
-        engine_config = {
-            "pool_size": 5,
-            "max_overflow": 10,
-            "pool_timeout": 30,
-            "pool_recycle": 3600,
-            "echo": False,
-        }
-        self.engine = create_engine(connection_string, **engine_config)
+        self.engine = create_engine(connection_string, **SERVER_POOL_CONFIG)
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
         self.logger.info("🐘 Engine PostgreSQL inicializado correctamente")
 
 
+class AsyncPostgreSQLStrategy:
+    """Estrategia asíncrona para PostgreSQL (asyncpg) usada por las dependencias de FastAPI"""
+
+    __slots__ = ("logger", "engine", "SessionLocal", "_conn_str", "error_handler")
+
+    def __init__(self, logger: logging.Logger = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.engine = None
+        self.SessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+        self._conn_str: Optional[str] = None
+        self.error_handler = ErrorHandler(self.logger)
+        self._initialize_engine_safe()
+
+    def get_connection_string(self) -> str:
+        """Reescribe DATABASE_URL para usar el driver asyncpg"""
+        if self._conn_str is None:
+            url = make_url(_get_db_settings().DATABASE_URL)
+            self._conn_str = url.set(drivername="postgresql+asyncpg").render_as_string(
+                hide_password=False
+            )
+        return self._conn_str
+
+    def _initialize_engine_safe(self):
+        """Inicializa el engine asíncrono (AsyncAdaptedQueuePool por defecto)"""
+        try:
+            self.engine = create_async_engine(
+                self.get_connection_string(), **SERVER_POOL_CONFIG
+            )
+            self.SessionLocal = async_sessionmaker(
+                autoflush=False, expire_on_commit=False, bind=self.engine
+            )
+            self.logger.info("🐘 Engine PostgreSQL asíncrono inicializado correctamente")
+        except Exception as e:
+            self.error_handler.handle_error(
+                e, ErrorType.DATABASE_ERROR, "Inicializando engine PostgreSQL asíncrono", fatal=True
+            )
+            raise
+
+    def get_session(self) -> AsyncSession:
+        """Retorna una nueva sesión asíncrona de PostgreSQL"""
+        if not self.SessionLocal:
+            raise RuntimeError("Engine PostgreSQL asíncrono no inicializado")
+        return self.SessionLocal()  # pylint: disable=not-callable
+
+
 class SQLiteStrategy(DatabaseStrategy):
     """Estrategia para base de datos SQLite con manejo robusto de errores"""
 
+    __slots__ = ("db_path",)
+
     def __init__(self, db_path: str = "database_sqlite.db", logger: logging.Logger = None):
         super().__init__(logger)
         self.db_path = self._validate_db_path(db_path)
@@ -100,19 +182,21 @@ class SQLiteStrategy(DatabaseStrategy):
 
     def _validate_db_path(self, db_path: str) -> str:
         """Valida y normaliza la ruta de la base de datos SQLite"""
+        if db_path in SQLITE_MEMORY_PATHS:
+            return db_path
+
         try:
-            # Si es ruta relativa, hacerla absoluta
-            if not os.path.isabs(db_path):
-                db_path = os.path.abspath(db_path)
+            # Normalizar a ruta absoluta (las relativas dependen del cwd actual)
+            abs_path = os.path.abspath(db_path)
 
-            # Crear directorio padre si no existe
-            parent_dir = os.path.dirname(db_path)
+            # Crear directorio padre si no existe (un solo stat si ya existe)
+            parent_dir = os.path.dirname(abs_path)
             if parent_dir and not os.path.exists(parent_dir):
                 os.makedirs(parent_dir, exist_ok=True)
                 self.logger.info(f"📁 Directorio creado para SQLite: {parent_dir}")
 
-            self.logger.debug(f"💾 Ruta SQLite validada: {db_path}")
-            return db_path
+            self.logger.debug(f"💾 Ruta SQLite validada: {abs_path}")
+            return abs_path
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -139,7 +223,23 @@ class SQLiteStrategy(DatabaseStrategy):
                 },
             }
 
+            if self.db_path in SQLITE_MEMORY_PATHS:
+                # Una única conexión compartida: sin gestión de pool
+                engine_config["poolclass"] = StaticPool
+            else:
+                # El reciclado no aplica a un archivo local
+                engine_config["pool_recycle"] = -1
+
             self.engine = create_engine(connection_string, **engine_config)
+
+            # Los PRAGMA son por conexión: se aplican una sola vez al abrirla
+            @event.listens_for(self.engine, "connect")
+            def _set_pragmas(dbapi_conn, _connection_record):
+                cursor = dbapi_conn.cursor()
+                for pragma in SQLITE_PRAGMAS:
+                    cursor.execute(pragma)
+                cursor.close()
+
             self.SessionLocal = sessionmaker(
                 autocommit=False, autoflush=False, bind=self.engine
             )
@@ -161,12 +261,7 @@ class SQLiteStrategy(DatabaseStrategy):
             raise RuntimeError("Engine SQLite no inicializado")
 
         try:
-            session = self.SessionLocal()
-            # Configurar SQLite para mejor concurrencia
-            session.execute(text("PRAGMA journal_mode=WAL"))
-            session.execute(text("PRAGMA synchronous=NORMAL"))
-            session.execute(text("PRAGMA cache_size=10000"))
-            return session
+            return self.SessionLocal()
         except Exception as e:
             self.error_handler.handle_error(
                 e, ErrorType.DATABASE_ERROR, "Creando sesión SQLite"
@@ -177,34 +272,35 @@ class SQLiteStrategy(DatabaseStrategy):
 class MySQLStrategy(DatabaseStrategy):
     """Estrategia para base de datos MySQL con manejo robusto de errores"""
 
+    __slots__ = ("_conn_str",)
+
     def __init__(self, logger: logging.Logger = None):
         super().__init__(logger)
+        self._conn_str: Optional[str] = None
         self._initialize_engine_safe()
 
     def get_connection_string(self) -> str:
         """Construye la cadena de conexión para MySQL con validación"""
+        if self._conn_str is not None:
+            return self._conn_str
+
         try:
-            user = os.getenv("MYSQL_USER", "root")
-            password = os.getenv("MYSQL_PASSWORD", "")
-            host = os.getenv("MYSQL_HOST", "localhost")
-            port = os.getenv("MYSQL_PORT", "3306")
-            database = os.getenv("MYSQL_DATABASE", "database_mysql")
-
-            # Validar parámetros críticos
-            if not user:
-                raise ValueError("Usuario MySQL no especificado")
-            if not database:
-                raise ValueError("Base de datos MySQL no especificada")
-
-            connection_string = (
-                f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
+            # Usuario y base de datos se validan (no vacíos) al cargar MySQLSettings
+            settings = _get_mysql_settings()
+            user = settings.MYSQL_USER
+            host = settings.MYSQL_HOST
+            port = settings.MYSQL_PORT
+            database = settings.MYSQL_DATABASE
+
+            self._conn_str = (
+                f"mysql+pymysql://{user}:{settings.MYSQL_PASSWORD}@{host}:{port}/{database}"
             )
 
             # Log seguro
             safe_string = f"mysql+pymysql://{user}:***@{host}:{port}/{database}"
             self.logger.debug(f"🐬 Cadena de conexión MySQL: {safe_string}")
 
-            return connection_string
+            return self._conn_str
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -222,11 +318,7 @@ class MySQLStrategy(DatabaseStrategy):
 
             # Configuraciones específicas para MySQL
             engine_config = {
-                "pool_size": 5,
-                "max_overflow": 10,
-                "pool_timeout": 30,
-                "pool_recycle": 3600,
-                "echo": False,
+                **SERVER_POOL_CONFIG,
                 "connect_args": {"charset": "utf8mb4", "connect_timeout": 10},
             }
 
@@ -243,21 +335,14 @@ class MySQLStrategy(DatabaseStrategy):
             )
             raise
 
-    @retry_with_backoff(
-        config=RetryConfig(max_retries=2, base_delay=1.0), retry_on=(SQLAlchemyError,)
-    )
     def get_session(self) -> Session:
         """Retorna una nueva sesión de MySQL"""
         if not self.SessionLocal:
             raise RuntimeError("Engine MySQL no inicializado")
 
         try:
-            session = self.SessionLocal()
-            # Configurar MySQL para mejor manejo de UTF-8
-            session.execute(text("SET NAMES utf8mb4"))
-            session.execute(text("SET CHARACTER SET utf8mb4"))
-            session.execute(text("SET character_set_connection=utf8mb4"))
-            return session
+            # El charset utf8mb4 ya se negocia en connect_args al abrir la conexión
+            return self.SessionLocal()
         except Exception as e:
             self.error_handler.handle_error(
                 e, ErrorType.DATABASE_ERROR, "Creando sesión MySQL"
@@ -271,6 +356,9 @@ class DatabaseStrategyFactory:
         "sqlite": SQLiteStrategy,
         "mysql": MySQLStrategy,
     }
+    _async_strategies = {
+        "postgresql": AsyncPostgreSQLStrategy,
+    }
 
     @classmethod
     def create_strategy(
@@ -285,6 +373,8 @@ class DatabaseStrategyFactory:
         strategy_class = cls._strategies[db_type]
         strategy = strategy_class(logger=logger, **kwargs)
 
+        # Comprobación barata (engine.connect), sin Session ni SELECT 1.
+        # Las conexiones caídas posteriores las detecta pool_pre_ping.
         if not strategy.validate_connection():
             raise RuntimeError(f"No se pudo validar conexión para {db_type}")
 
@@ -293,3 +383,18 @@ class DatabaseStrategyFactory:
             logger.info(f"✅ Estrategia {db_type} creada y validada exitosamente")
 
         return strategy
+
+    @classmethod
+    def supports_async(cls, db_type: str) -> bool:
+        """Indica si db_type cuenta con una estrategia asíncrona"""
+        return db_type in cls._async_strategies
+
+    @classmethod
+    def create_async_strategy(
+        cls, db_type: str, logger: logging.Logger = None
+    ) -> Optional[AsyncPostgreSQLStrategy]:
+        """Retorna la estrategia asíncrona para db_type, o None si no existe driver async"""
+        strategy_class = cls._async_strategies.get(db_type)
+        if strategy_class is None:
+            return None
+        return strategy_class(logger=logger)
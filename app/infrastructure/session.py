@@ -1,24 +1,116 @@
 """
 Módulo de configuración de la base de datos usando DatabaseStrategyFactory.
 Provee la dependencia `get_db` para FastAPI.
+
+Con PostgreSQL `get_db` entrega una `AsyncSession` (asyncpg) para no bloquear
+el event loop; el resto de motores mantienen la sesión síncrona.
+
+Las estrategias se construyen en `init_db()`, invocado desde el `lifespan` de
+la aplicación, de modo que importar este módulo no requiere una BD activa.
 """
 
 import os
-from app.infrastructure.database_strategies import DatabaseStrategyFactory
+import tempfile
+from contextlib import contextmanager
+from typing import Optional
+from app.infrastructure.database_strategies import (
+    AsyncPostgreSQLStrategy,
+    DatabaseStrategy,
+    DatabaseStrategyFactory,
+)
 
 DB_TYPE = os.getenv("DB", "sqlite")
 
-db_strategy = DatabaseStrategyFactory.create_strategy(db_type=DB_TYPE)
+# La estrategia síncrona se mantiene para scripts, migraciones y creación de tablas
+db_strategy: Optional[DatabaseStrategy] = None
+
+async_db_strategy: Optional[AsyncPostgreSQLStrategy] = None
+
+# Lock compartido por los workers de uvicorn del mismo host durante el DDL inicial
+INIT_DB_LOCK_PATH = os.path.join(tempfile.gettempdir(), "app_init_db.lock")
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sin fcntl (Windows)
+    fcntl = None
+
+
+@contextmanager
+def _init_db_lock():
+    """
+    Serializa la creación de estrategias entre procesos: con varios workers,
+    el DDL concurrente sobre una BD nueva falla con "table already exists".
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(INIT_DB_LOCK_PATH, "a", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def init_db():
+    """
+    Crea las estrategias de base de datos (conexión y tablas).
+    Es idempotente: llamadas posteriores no vuelven a inicializar.
+    """
+    global db_strategy, async_db_strategy  # pylint: disable=global-statement
+    if db_strategy is None:
+        with _init_db_lock():
+            db_strategy = DatabaseStrategyFactory.create_strategy(db_type=DB_TYPE)
+    if async_db_strategy is None:
+        async_db_strategy = DatabaseStrategyFactory.create_async_strategy(db_type=DB_TYPE)
+        if async_db_strategy is not None:
+            # Las requests usan el engine asíncrono; el síncrono solo ejecutó el DDL
+            # (create_strategy), así que se liberan sus conexiones ociosas
+            db_strategy.engine.dispose()
 
-SessionLocal = db_strategy.get_session
 
-def get_db():
+async def close_db():
     """
-    Genera una sesión de base de datos para FastAPI.
-    Cierra automáticamente la sesión cuando la operación termina.
+    Libera los pools de conexiones al apagar la aplicación.
+    El engine asyncpg debe cerrarse con await antes de que termine el event loop.
     """
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
+    global db_strategy, async_db_strategy  # pylint: disable=global-statement
+    if async_db_strategy is not None:
+        await async_db_strategy.engine.dispose()
+        async_db_strategy = None
+    if db_strategy is not None:
+        db_strategy.engine.dispose()
+        db_strategy = None
+
+
+def SessionLocal():  # pylint: disable=invalid-name
+    """Retorna una nueva sesión síncrona de la estrategia activa."""
+    if db_strategy is None:
+        raise RuntimeError("Base de datos no inicializada: llame a init_db()")
+    return db_strategy.get_session()
+
+
+if DatabaseStrategyFactory.supports_async(DB_TYPE):
+
+    async def get_db():
+        """
+        Genera una sesión asíncrona de base de datos para FastAPI.
+        Cierra automáticamente la sesión cuando la operación termina.
+        """
+        if async_db_strategy is None:
+            raise RuntimeError("Base de datos no inicializada: llame a init_db()")
+        async with async_db_strategy.get_session() as session:
+            yield session
+
+else:
+
+    def get_db():
+        """
+        Genera una sesión de base de datos para FastAPI.
+        Cierra automáticamente la sesión cuando la operación termina.
+        """
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
@@ -1,51 +1,85 @@
 import os
+import json
+from contextlib import asynccontextmanager
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.infrastructure import session  
+from app.infrastructure import session
 
 PROJECT_NAME = os.getenv("PROJECT_NAME", "My FastAPI Project")
 VERSION = os.getenv("VERSION", "1.0.0")
 DESCRIPTION = os.getenv("DESCRIPTION", "Generic FastAPI Boilerplate API.")
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Inicializa la base de datos al arrancar la aplicación, no al importarla,
+    y libera las conexiones al apagarla.
+    """
+    session.init_db()
+    yield
+    await session.close_db()
+
 app = FastAPI(
     title=PROJECT_NAME,
     version=VERSION,
     description=DESCRIPTION,
+    lifespan=lifespan,
+)
+
+# frozenset de orígenes sin espacios: búsqueda O(1) en cada request CORS.
+# Un valor vacío no permite ningún origen.
+CORS_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
+    if origin.strip()
 )
+# Con CORS_ALLOW_CREDENTIALS=0 no se envía Access-Control-Allow-Credentials y,
+# con origen "*", el preflight responde "*" en lugar de reflejar el Origin.
+# Las respuestas simples con cookies reflejan el Origin en ambos modos.
+CORS_ALLOW_CREDENTIALS = os.getenv("CORS_ALLOW_CREDENTIALS", "1") == "1"
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=os.getenv("CORS_ALLOW_ORIGINS", "*").split(","),
-    allow_credentials=True,
+    # Starlette reconoce el comodín solo como el centinela ["*"]
+    allow_origins=["*"] if "*" in CORS_ORIGINS else CORS_ORIGINS,
+    allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Respuesta estática: se serializa una sola vez al cargar el módulo, con el
+# mismo formato compacto UTF-8 que JSONResponse
+ROOT_BODY = json.dumps({
+    "project": PROJECT_NAME,
+    "version": VERSION,
+    "status": "running",
+    "db_type": os.getenv("DB_TYPE", "sqlite")
+}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 @app.get("/")
 async def root():
     """
     Endpoint básico de bienvenida.
     """
-    return {
-        "project": PROJECT_NAME,
-        "version": VERSION,
-        "status": "running",
-        "db_type": os.getenv("DB_TYPE", "sqlite")
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 # Incluir routers (ejemplo)
 # from app.interfaces.api import some_router
 # app.include_router(some_router, prefix="/api", tags=["Example"])
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=os.getenv("HOST", "0.0.0.0"),
-        port=int(os.getenv("PORT", 8000)),
-        reload = os.getenv("RELOAD", "1") == "1",
-        reload_dirs=[os.path.dirname(os.path.abspath(__file__))],
-        reload_excludes=[
+    reload = os.getenv("RELOAD", "0") == "1"
+    # --reload solo admite un worker. Sin WEB_CONCURRENCY se limita a 4 workers:
+    # cada uno abre hasta 15 conexiones (pool_size + max_overflow)
+    workers = 1 if reload else int(
+        os.getenv("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4))
+    )
+    # Las opciones reload_* solo se pasan con reload activo; si no, uvicorn avisa
+    # de que la configuración no recargará
+    reload_config = {
+        "reload_dirs": [os.path.dirname(os.path.abspath(__file__))],
+        "reload_excludes": [
             "*/.git/*",
             "*/__pycache__/*",
             "*.pyc",
@@ -53,6 +87,14 @@ if __name__ == "__main__":
             "*/.vscode/*",
             "*/.idea/*"
         ],
-        reload_delay=1,
-        reload_includes=["*.py", "*.html", "*.css", "*.js"]
+        "reload_delay": 1,
+        "reload_includes": ["*.py", "*.html", "*.css", "*.js"],
+    } if reload else {}
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", 8000)),
+        workers=workers,
+        reload=reload,
+        **reload_config,
     )
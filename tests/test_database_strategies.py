@@ -0,0 +1,151 @@
+"""
+Pruebas de las estrategias de base de datos sobre SQLite.
+"""
+
+import os
+import shutil
+
+import pytest
+from sqlalchemy import Column, Integer, Table, inspect, text
+
+from app.infrastructure.base import Base
+from app.infrastructure.database_strategies import (
+    DatabaseStrategyFactory,
+    SQLiteStrategy,
+)
+
+
+@pytest.fixture
+def model_tables():
+    """Registra tablas de prueba en Base.metadata y las retira al terminar."""
+    tables = [
+        Table(name, Base.metadata, Column("id", Integer, primary_key=True))
+        for name in ("t1", "t2")
+    ]
+    yield {table.name for table in tables}
+    for table in tables:
+        Base.metadata.remove(table)
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    strategy = SQLiteStrategy(str(tmp_path / "db.sqlite"))
+
+    with strategy.get_session() as session:
+        assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # synchronous=NORMAL se reporta como 1
+        assert session.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert session.execute(text("PRAGMA cache_size")).scalar() == 10000
+
+
+def test_memory_sqlite_path_is_kept():
+    assert SQLiteStrategy(":memory:").db_path == ":memory:"
+
+
+def test_factory_strategy_reports_valid_connection(tmp_path):
+    strategy = DatabaseStrategyFactory.create_strategy(
+        "sqlite", db_path=str(tmp_path / "db.sqlite")
+    )
+
+    assert strategy.is_connection_valid()
+
+
+def test_existing_tables_skip_create_all(tmp_path, model_tables, monkeypatch):
+    db_path = str(tmp_path / "db.sqlite")
+    DatabaseStrategyFactory.create_strategy("sqlite", db_path=db_path).engine.dispose()
+
+    def fail_create_all(*args, **kwargs):
+        raise AssertionError("create_all no debería ejecutarse")
+
+    monkeypatch.setattr(Base.metadata, "create_all", fail_create_all)
+    strategy = DatabaseStrategyFactory.create_strategy("sqlite", db_path=db_path)
+
+    assert model_tables <= set(inspect(strategy.engine).get_table_names())
+
+
+def test_recreated_database_gets_tables_again(tmp_path, model_tables):
+    db_path = str(tmp_path / "db.sqlite")
+    DatabaseStrategyFactory.create_strategy("sqlite", db_path=db_path).engine.dispose()
+    os.remove(db_path)
+
+    strategy = DatabaseStrategyFactory.create_strategy("sqlite", db_path=db_path)
+
+    assert model_tables <= set(inspect(strategy.engine).get_table_names())
+
+
+def _spy_create_all(monkeypatch):
+    calls = []
+    create_all = Base.metadata.create_all
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs.get("checkfirst", True))
+        return create_all(*args, **kwargs)
+
+    monkeypatch.setattr(Base.metadata, "create_all", spy)
+    return calls
+
+
+def test_fresh_database_creates_tables_without_checkfirst(
+    tmp_path, model_tables, monkeypatch
+):
+    calls = _spy_create_all(monkeypatch)
+
+    strategy = DatabaseStrategyFactory.create_strategy(
+        "sqlite", db_path=str(tmp_path / "db.sqlite")
+    )
+
+    assert calls == [False]
+    assert model_tables <= set(inspect(strategy.engine).get_table_names())
+
+
+def test_partial_database_creates_missing_tables_with_checkfirst(
+    tmp_path, model_tables, monkeypatch
+):
+    strategy = SQLiteStrategy(str(tmp_path / "db.sqlite"))
+    with strategy.engine.begin() as connection:
+        connection.execute(text("CREATE TABLE t1 (id INTEGER PRIMARY KEY)"))
+    calls = _spy_create_all(monkeypatch)
+
+    strategy.create_tables_if_not_exist()
+
+    assert calls == [True]
+    assert model_tables <= set(inspect(strategy.engine).get_table_names())
+
+
+def test_relative_sqlite_path_follows_current_directory(monkeypatch, tmp_path):
+    first_dir = tmp_path / "t1"
+    second_dir = tmp_path / "t2"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    monkeypatch.chdir(first_dir)
+    first = SQLiteStrategy("data/db.sqlite")
+    monkeypatch.chdir(second_dir)
+    second = SQLiteStrategy("data/db.sqlite")
+
+    assert first.db_path == str(first_dir / "data" / "db.sqlite")
+    assert second.db_path == str(second_dir / "data" / "db.sqlite")
+
+
+def test_sqlite_path_recreates_missing_parent(tmp_path):
+    db_path = str(tmp_path / "data" / "db.sqlite")
+    first = SQLiteStrategy(db_path)
+    assert first.validate_connection()
+    first.engine.dispose()
+    shutil.rmtree(tmp_path / "data")
+
+    strategy = SQLiteStrategy(db_path)
+
+    assert os.path.isdir(tmp_path / "data")
+    assert strategy.validate_connection()
+
+
+def test_existing_sqlite_parent_costs_one_stat(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "db.sqlite")
+    strategy = SQLiteStrategy(db_path)
+    calls = []
+    stat, mkdir = os.stat, os.mkdir
+    monkeypatch.setattr(os, "stat", lambda *a, **k: calls.append("stat") or stat(*a, **k))
+    monkeypatch.setattr(os, "mkdir", lambda *a, **k: calls.append("mkdir") or mkdir(*a, **k))
+
+    assert strategy._validate_db_path(db_path) == db_path  # pylint: disable=protected-access
+    assert calls == ["stat"]
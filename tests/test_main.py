@@ -0,0 +1,105 @@
+"""
+Pruebas de la aplicación FastAPI: importación sin BD y configuración de CORS.
+"""
+
+import importlib
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+import app.main
+from app.infrastructure import session
+
+
+@pytest.fixture
+def reload_main(monkeypatch):
+    """
+    Recarga `app.main` con las variables de entorno indicadas y, al terminar,
+    la vuelve a recargar con el entorno original para no filtrar configuración.
+    """
+
+    def _reload(**env):
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        return importlib.reload(app.main)
+
+    yield _reload
+    monkeypatch.undo()
+    importlib.reload(app.main)
+
+
+def test_import_does_not_initialize_database(reload_main, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    main_module = reload_main()
+
+    assert session.db_strategy is None
+    assert session.async_db_strategy is None
+    assert list(tmp_path.iterdir()) == []
+    assert TestClient(main_module.app).get("/").json()["status"] == "running"
+
+
+def test_root_body_matches_json_response(reload_main):
+    main_module = reload_main(PROJECT_NAME="Proyecto Ñandú", DB_TYPE="sqlite")
+    expected = JSONResponse({
+        "project": "Proyecto Ñandú",
+        "version": main_module.VERSION,
+        "status": "running",
+        "db_type": "sqlite",
+    }).body
+
+    response = TestClient(main_module.app).get("/")
+
+    assert response.content == expected
+    assert response.headers["content-type"] == "application/json"
+
+
+def _allowed_origin(main_module, origin: str):
+    # Sin `with`, TestClient no ejecuta el lifespan: no se toca la BD
+    client = TestClient(main_module.app)
+    response = client.get("/", headers={"Origin": origin})
+    return response.headers.get("access-control-allow-origin")
+
+
+@pytest.mark.parametrize("origins", ["", "  ", " , ,"])
+def test_empty_cors_origins_allow_no_origin(reload_main, origins):
+    main_module = reload_main(CORS_ALLOW_ORIGINS=origins)
+
+    assert main_module.CORS_ORIGINS == frozenset()
+    assert _allowed_origin(main_module, "https://evil.com") is None
+
+
+def test_cors_origins_are_stripped(reload_main):
+    main_module = reload_main(CORS_ALLOW_ORIGINS=" https://a.com , https://b.com ")
+
+    assert main_module.CORS_ORIGINS == frozenset({"https://a.com", "https://b.com"})
+    assert _allowed_origin(main_module, "https://b.com") == "https://b.com"
+    assert _allowed_origin(main_module, "https://evil.com") is None
+
+
+def test_cors_wildcard_allows_any_origin(reload_main):
+    main_module = reload_main(CORS_ALLOW_ORIGINS="*")
+
+    assert _allowed_origin(main_module, "https://any.com") == "*"
+
+
+def _preflight(main_module, origin: str):
+    client = TestClient(main_module.app)
+    return client.options(
+        "/", headers={"Origin": origin, "Access-Control-Request-Method": "GET"}
+    )
+
+
+def test_cors_credentials_enabled_by_default(reload_main):
+    response = _preflight(reload_main(CORS_ALLOW_ORIGINS="*"), "https://x.com")
+
+    assert response.headers["access-control-allow-origin"] == "https://x.com"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+def test_cors_credentials_disabled(reload_main):
+    main_module = reload_main(CORS_ALLOW_ORIGINS="*", CORS_ALLOW_CREDENTIALS="0")
+    response = _preflight(main_module, "https://x.com")
+
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in response.headers